@@ -11,28 +11,42 @@ def single_process(process_func, process_infos):
     return results
 
 
-def multiprocessing_wrapper(process_func, process_infos, n_processes):
+def _pool_map(pool, process_func, process_infos):
+    # hand out one search at a time, so a process that finishes early picks up
+    # the next search instead of waiting for a pre-assigned chunk
+    return list(pool.imap(process_func, process_infos, chunksize=1))
+
+
+def multiprocessing_wrapper(process_func, process_infos, n_processes, **kwargs):
     import multiprocessing as mp
 
-    pool = mp.Pool(n_processes, initializer=tqdm.set_lock, initargs=(tqdm.get_lock(),))
-    results = pool.map(process_func, process_infos)
+    kwargs.setdefault("initializer", tqdm.set_lock)
+    kwargs.setdefault("initargs", (tqdm.get_lock(),))
+
+    # a new pool per run, with the fork start method the workers then see the
+    # current state of __main__
+    with mp.Pool(n_processes, **kwargs) as pool:
+        results = _pool_map(pool, process_func, process_infos)
 
     return results
 
 
-def pathos_wrapper(process_func, search_processes_paras, n_processes):
+def pathos_wrapper(process_func, search_processes_paras, n_processes, **kwargs):
     import pathos.multiprocessing as pmp
 
-    pool = pmp.Pool(n_processes, initializer=tqdm.set_lock, initargs=(tqdm.get_lock(),))
-    results = pool.map(process_func, search_processes_paras)
+    kwargs.setdefault("initializer", tqdm.set_lock)
+    kwargs.setdefault("initargs", (tqdm.get_lock(),))
+
+    pool = pmp.Pool(n_processes, **kwargs)
+    results = _pool_map(pool, process_func, search_processes_paras)
 
     return results
 
 
-def joblib_wrapper(process_func, search_processes_paras, n_processes):
+def joblib_wrapper(process_func, search_processes_paras, n_processes, **kwargs):
     from joblib import Parallel, delayed
 
     jobs = [delayed(process_func)(*info_dict) for info_dict in search_processes_paras]
-    results = Parallel(n_jobs=n_processes)(jobs)
+    results = Parallel(n_jobs=n_processes, **kwargs)(jobs)
 
     return results
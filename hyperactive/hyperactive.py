@@ -34,6 +34,26 @@ class Hyperactive:
 
         self.opt_pros = {}
 
+        self._managers = []
+        self._opt_pros_shared = []
+
+    def __getstate__(self):
+        # managers cannot be pickled, the memory proxies keep their own reference
+        state = self.__dict__.copy()
+        state["_managers"] = []
+        state["_opt_pros_shared"] = []
+        return state
+
+    def close(self):
+        # shut down the managers of the shared memory, the next run starts new ones
+        for opt_pros in self._opt_pros_shared:
+            opt_pros.memory = "share"
+        self._opt_pros_shared = []
+
+        for manager in self._managers:
+            manager.shutdown()
+        self._managers = []
+
     def _create_shared_memory(self):
         _bundle_opt_processes = {}
 
@@ -53,10 +73,13 @@ class Hyperactive:
 
                 if idx == 0 or not ss_equal:
                     manager = mp.Manager()  # get new manager.dict
+                    self._managers.append(manager)
                     opt_pros.memory = manager.dict()
                 else:
                     opt_pros.memory = opt_pros_l[0].memory  # get same manager.dict
 
+                self._opt_pros_shared.append(opt_pros)
+
     @staticmethod
     def _default_opt(optimizer):
         if isinstance(optimizer, str):
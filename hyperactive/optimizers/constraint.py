@@ -3,11 +3,11 @@
 # License: MIT License
 
 
-def gfo2hyper(search_space, para):
+def gfo2hyper(search_dims, para):
     values_dict = {}
-    for _, key in enumerate(search_space.keys()):
+    for key, dim_values in search_dims:
         pos_ = int(para[key])
-        values_dict[key] = search_space[key][pos_]
+        values_dict[key] = dim_values[pos_]
 
     return values_dict
 
@@ -17,6 +17,8 @@ class Constraint:
         self.constraint = constraint
         self.search_space = search_space
 
+        self.search_dims = [(key, search_space[key]) for key in search_space.keys()]
+
     def __call__(self, para):
-        para = gfo2hyper(self.search_space, para)
+        para = gfo2hyper(self.search_dims, para)
         return self.constraint(para)
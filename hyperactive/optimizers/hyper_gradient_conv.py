@@ -10,10 +10,39 @@ class HyperGradientConv:
     def __init__(self, s_space):
         self.s_space = s_space
 
+        # lookup structures are built once and reused for every converted value
+        self.dim_arrays = {}
+        self.dim_indices = {}
+        self.dim_values = {}
+        for dim_key in self.s_space.dim_keys:
+            space_dim = self.s_space.func2str[dim_key]
+
+            if self.s_space.data_types[dim_key] == "number":
+                self.dim_arrays[dim_key] = np.array(space_dim)
+                self.dim_values[dim_key] = self.dim_arrays[dim_key]
+            else:
+                dim_indices = {}
+                for idx, value in enumerate(space_dim):
+                    dim_indices.setdefault(value, idx)
+                self.dim_indices[dim_key] = dim_indices
+
+                dim_values = np.empty(len(space_dim), dtype=object)
+                dim_values[:] = self.s_space[dim_key]
+                self.dim_values[dim_key] = dim_values
+
+    def _dim_index(self, dim_key, value):
+        # unhashable values (e.g. lists) cannot be in the dimension either
+        try:
+            return self.dim_indices[dim_key][value]
+        except (KeyError, TypeError):
+            raise ValueError(
+                "'{}' was not found in '{}'".format(value, dim_key)
+            ) from None
+
     def value2position(self, value: list) -> list:
         position = []
-        for n, space_dim in enumerate(self.s_space.values_l):
-            pos = np.abs(value[n] - np.array(space_dim)).argmin()
+        for n, dim_key in enumerate(self.s_space.dim_keys):
+            pos = np.abs(value[n] - self.dim_arrays[dim_key]).argmin()
             position.append(int(pos))
 
         return position
@@ -63,19 +92,12 @@ class HyperGradientConv:
         para_gfo = {}
         for para in self.s_space.dim_keys:
             value_hyper = para_hyper[para]
-            space_dim = list(self.s_space.func2str[para])
 
             if self.s_space.data_types[para] == "number":
-                value_gfo = np.abs(value_hyper - np.array(space_dim)).argmin()
+                value_gfo = np.abs(value_hyper - self.dim_arrays[para]).argmin()
             else:
                 value_hyper = self.value_func2str(value_hyper)
-
-                if value_hyper in space_dim:
-                    value_gfo = space_dim.index(value_hyper)
-                else:
-                    raise ValueError(
-                        "'{}' was not found in '{}'".format(value_hyper, para)
-                    )
+                value_gfo = self._dim_index(para, value_hyper)
 
             para_gfo[para] = value_gfo
         return para_gfo
@@ -92,25 +114,23 @@ class HyperGradientConv:
 
         return initialize
 
-    def get_list_positions(self, list1_values, search_dim):
+    def get_list_positions(self, list1_values, dim_key):
         list_positions = []
 
         for value2 in list1_values:
-            list_positions.append(search_dim.index(value2))
+            list_positions.append(self._dim_index(dim_key, value2))
 
         return list_positions
 
-    def values2positions(self, values, search_dim):
-        return np.array(search_dim).searchsorted(values)
+    def values2positions(self, values, dim_key):
+        return self.dim_arrays[dim_key].searchsorted(values)
 
     def positions2results(self, positions):
         results_dict = {}
 
         for para_name in self.s_space.dim_keys:
-            values_list = self.s_space[para_name]
-            pos_ = positions[para_name].values
-            values_ = [values_list[idx] for idx in pos_]
-            results_dict[para_name] = values_
+            pos_ = positions[para_name].to_numpy(dtype=np.int64)
+            results_dict[para_name] = self.dim_values[para_name][pos_]
 
         results = pd.DataFrame.from_dict(results_dict)
 
@@ -123,12 +143,9 @@ class HyperGradientConv:
         if results is None:
             return results
 
-        results.reset_index(inplace=True, drop=True)
-
         df_positions_dict = {}
         for dim_key in self.s_space.dim_keys:
-            result_dim_values = list(results[dim_key].values)
-            search_dim = self.s_space.func2str[dim_key]
+            result_dim_values = results[dim_key].to_numpy()
 
             if self.s_space.data_types[dim_key] == "object":
                 result_dim_values_tmp = []
@@ -142,9 +159,9 @@ class HyperGradientConv:
 
                 result_dim_values = result_dim_values_tmp
 
-                list1_positions = self.get_list_positions(result_dim_values, search_dim)
+                list1_positions = self.get_list_positions(result_dim_values, dim_key)
             else:
-                list1_positions = self.values2positions(result_dim_values, search_dim)
+                list1_positions = self.values2positions(result_dim_values, dim_key)
 
             # remove None
             # list1_positions_ = [x for x in list1_positions if x is not None]
@@ -152,7 +169,7 @@ class HyperGradientConv:
 
         results_new = pd.DataFrame(df_positions_dict)
 
-        results_new["score"] = results["score"]
+        results_new["score"] = results["score"].to_numpy()
         results_new.dropna(how="any", inplace=True)
 
         return results_new
@@ -71,12 +71,13 @@ class HyperOptimizer(OptimizerAttributes):
 
         self.search_data = self.hg_conv.positions2results(self.positions)
 
-        results_dd = self.gfo_optimizer.search_data.drop_duplicates(
+    @property
+    def memory_values_df(self):
+        # only computed on access, the search itself does not need it
+        results_dd = self.positions.drop_duplicates(
             subset=self.s_space.dim_keys, keep="first"
         )
-        self.memory_values_df = results_dd[
-            self.s_space.dim_keys + ["score"]
-        ].reset_index(drop=True)
+        return results_dd[self.s_space.dim_keys + ["score"]].reset_index(drop=True)
 
     def _setup_process(self, nth_process):
         self.nth_process = nth_process
@@ -133,31 +134,38 @@ class HyperOptimizer(OptimizerAttributes):
             memory_warm_start,
             False,
         )
-        for nth_iter in range(self.n_iter):
-            if p_bar:
-                p_bar.set_description(
-                    "["
-                    + str(nth_process)
-                    + "] "
-                    + str(self.objective_function.__name__)
-                    + " ("
-                    + self.optimizer_class.name
-                    + ")",
-                )
 
-            self.gfo_optimizer.search_step(nth_iter)
-            if self.gfo_optimizer.stop.check():
+        # the description does not change during the search
+        if p_bar:
+            p_bar.set_description(
+                "["
+                + str(nth_process)
+                + "] "
+                + str(self.objective_function.__name__)
+                + " ("
+                + self.optimizer_class.name
+                + ")",
+                refresh=False,
+            )
+
+        # the gfo optimizer is mutated in place by search_step, bind it once
+        gfo_optimizer = self.gfo_optimizer
+
+        for nth_iter in range(self.n_iter):
+            gfo_optimizer.search_step(nth_iter)
+            if gfo_optimizer.stop.check():
                 break
 
             if p_bar:
+                # the bar is redrawn by update() at most every mininterval seconds
                 p_bar.set_postfix(
-                    best_score=str(gfo_wrapper_model.optimizer.score_best),
-                    best_pos=str(gfo_wrapper_model.optimizer.pos_best),
-                    best_iter=str(gfo_wrapper_model.optimizer.p_bar._best_since_iter),
+                    best_score=str(gfo_optimizer.score_best),
+                    best_pos=str(gfo_optimizer.pos_best),
+                    best_iter=str(gfo_optimizer.p_bar._best_since_iter),
+                    refresh=False,
                 )
 
                 p_bar.update(1)
-                p_bar.refresh()
 
         self.gfo_optimizer.finish_search()
 
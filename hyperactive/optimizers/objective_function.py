@@ -6,11 +6,11 @@
 from .dictionary import DictClass
 
 
-def gfo2hyper(search_space, para):
+def gfo2hyper(search_dims, para):
     values_dict = {}
-    for _, key in enumerate(search_space.keys()):
+    for key, dim_values in search_dims:
         pos_ = int(para[key])
-        values_dict[key] = search_space[key][pos_]
+        values_dict[key] = dim_values[pos_]
 
     return values_dict
 
@@ -32,10 +32,13 @@ class ObjectiveFunction(DictClass):
             [callback(self) for callback in self.callbacks[type_]]
 
     def __call__(self, search_space):
+        # the dimensions are collected once per search instead of per evaluation
+        search_dims = [(key, search_space[key]) for key in search_space.keys()]
+
         # wrapper for GFOs
         def _model(para):
             self.nth_iter = len(self.optimizer.pos_l)
-            para = gfo2hyper(search_space, para)
+            para = gfo2hyper(search_dims, para)
             self.para_dict = para
 
             try:
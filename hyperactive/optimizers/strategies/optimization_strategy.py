@@ -125,3 +125,8 @@ class BaseOptimizationStrategy(OptimizerAttributes):
                 hyper_opt.search_data,
                 hyper_opt.gfo_optimizer.random_seed,
             )
+
+            # the remaining optimizers cannot improve on a reached max_score,
+            # a falsy max_score (None or 0) disables the stop like in gfo
+            if self.max_score and self.best_score >= self.max_score:
+                break
@@ -15,35 +15,49 @@ class Results:
         self.objFunc2results = {}
         self.search_id2results = {}
 
+        # per process attributes as parallel sequences, collected once
+        self.objective_functions = [
+            opt_pros[results_["nth_process"]].objective_function
+            for results_ in results_list
+        ]
+        self.best_scores = np.array(
+            [results_["best_score"] for results_ in results_list], dtype=np.float64
+        )
+        self.best_scores[np.isnan(self.best_scores)] = -np.inf
+
     def _sort_results_objFunc(self, objective_function):
         best_score = -np.inf
         best_para = None
         search_data = None
+        params = None
 
-        search_data_list = []
-
-        for results_ in self.results_list:
-            nth_process = results_["nth_process"]
+        idx_objFunc = [
+            idx
+            for idx, objective_function_ in enumerate(self.objective_functions)
+            if objective_function_ == objective_function
+        ]
 
-            opt = self.opt_pros[nth_process]
-            objective_function_ = opt.objective_function
-            search_space_ = opt.s_space()
-            params = list(search_space_.keys())
+        if len(idx_objFunc) > 0:
+            nth_process = self.results_list[idx_objFunc[-1]]["nth_process"]
+            params = list(self.opt_pros[nth_process].s_space().keys())
 
-            if objective_function_ != objective_function:
-                continue
+            scores = self.best_scores[idx_objFunc]
+            idx_best = int(scores.argmax())
+            if scores[idx_best] > best_score:
+                results_best = self.results_list[idx_objFunc[idx_best]]
+                best_score = results_best["best_score"]
+                best_para = results_best["best_para"]
 
-            if results_["best_score"] > best_score:
-                best_score = results_["best_score"]
-                best_para = results_["best_para"]
+            search_data_list = []
+            for idx in idx_objFunc:
+                results_ = self.results_list[idx]
 
-            search_data = results_["search_data"]
-            search_data["eval_times"] = results_["eval_times"]
-            search_data["iter_times"] = results_["iter_times"]
+                search_data = results_["search_data"]
+                search_data["eval_times"] = results_["eval_times"]
+                search_data["iter_times"] = results_["iter_times"]
 
-            search_data_list.append(search_data)
+                search_data_list.append(search_data)
 
-        if len(search_data_list) > 0:
             search_data = pd.concat(search_data_list)
 
         self.objFunc2results[objective_function] = {
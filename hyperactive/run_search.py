@@ -28,8 +28,7 @@ def _get_distribution(distribution):
         return (distribution, _process_), {}
 
     elif isinstance(distribution, dict):
-        dist_key = list(distribution.keys())[0]
-        dist_paras = list(distribution.values())[0]
+        dist_key, dist_paras = next(iter(distribution.items()))
 
         return dist_dict[dist_key], dist_paras
 
@@ -38,11 +37,7 @@ def _get_distribution(distribution):
 
 
 def run_search(opt_pros, distribution, n_processes):
-    opts = list(opt_pros.values())
-
-    processes = list(opt_pros.keys())
-    optimizers = list(opt_pros.values())
-    process_infos = list(zip(processes, optimizers))
+    process_infos = list(opt_pros.items())
 
     if n_processes == "auto":
         n_processes = len(process_infos)
@@ -52,6 +47,8 @@ def run_search(opt_pros, distribution, n_processes):
     else:
         (distribution, process_func), dist_paras = _get_distribution(distribution)
 
-        results_list = distribution(process_func, process_infos, n_processes)
+        results_list = distribution(
+            process_func, process_infos, n_processes, **dist_paras
+        )
 
     return results_list
@@ -1,4 +1,6 @@
+import pytest
 import numpy as np
+import multiprocessing as mp
 from tqdm import tqdm
 from hyperactive import Hyperactive
 
@@ -115,6 +117,20 @@ def test_joblib_1():
     hyper.run()
 
 
+def test_joblib_2():
+    hyper = Hyperactive(
+        distribution={
+            "joblib": {
+                "backend": "not_a_backend",
+            }
+        },
+    )
+    hyper.add_search(objective_function, search_space, n_iter=15, n_jobs=2)
+
+    with pytest.raises(ValueError):
+        hyper.run()
+
+
 def test_pathos_0():
     hyper = Hyperactive(distribution="pathos")
     hyper.add_search(objective_function, search_space, n_iter=15, n_jobs=2)
@@ -168,3 +184,40 @@ def test_n_processes_5():
     hyper.run()
 
     assert len(hyper.results_list) == 8
+
+
+OFFSET = 0
+
+
+def objective_function_offset(opt):
+    score = -(opt["x1"] - OFFSET) ** 2
+    return score
+
+
+# workers only inherit the changed global with the fork start method
+@pytest.mark.skipif(
+    mp.get_start_method() != "fork", reason="requires the fork start method"
+)
+def test_global_change_between_runs():
+    global OFFSET
+
+    hyper = Hyperactive(n_processes=2)
+    hyper.add_search(
+        objective_function_offset,
+        {"x1": [0, 5]},
+        n_iter=5,
+        n_jobs=2,
+        initialize={"warm_start": [{"x1": 0}, {"x1": 5}]},
+        memory=False,
+    )
+
+    OFFSET = 0
+    hyper.run()
+    assert hyper.best_para(objective_function_offset) == {"x1": 0}
+
+    OFFSET = 5
+    try:
+        hyper.run()
+    finally:
+        OFFSET = 0
+    assert hyper.best_para(objective_function_offset) == {"x1": 5}
@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+
+
+from hyperactive import Hyperactive
+from hyperactive.optimizers.strategies import CustomOptimizationStrategy
+from hyperactive.optimizers import RandomSearchOptimizer
+
+from ._parametrize import optimizers
+
+
+@pytest.mark.parametrize(*optimizers)
+def test_strategy_max_score_0(Optimizer):
+    def objective_function(para):
+        score = -para["x1"] * para["x1"]
+        return score
+
+    search_space = {
+        "x1": list(np.arange(0, 100, 0.1)),
+    }
+
+    optimizer1 = Optimizer()
+    optimizer2 = RandomSearchOptimizer()
+
+    opt_strat = CustomOptimizationStrategy()
+    opt_strat.add_optimizer(optimizer1, duration=0.5)
+    opt_strat.add_optimizer(optimizer2, duration=0.5)
+
+    n_iter = 30
+
+    hyper = Hyperactive()
+    hyper.add_search(
+        objective_function,
+        search_space,
+        optimizer=opt_strat,
+        n_iter=n_iter,
+        max_score=-1,
+        initialize={"warm_start": [{"x1": 0}]},
+    )
+    hyper.run()
+
+    optimizer2 = hyper.opt_pros[0].optimizer_setup_l[1]["optimizer"]
+
+    assert hyper.best_score(objective_function) == 0
+    assert optimizer2.search_data is None
+
+
+@pytest.mark.parametrize(*optimizers)
+def test_strategy_max_score_1(Optimizer):
+    def objective_function(para):
+        score = -para["x1"] * para["x1"]
+        return score
+
+    search_space = {
+        "x1": list(np.arange(0, 100, 0.1)),
+    }
+
+    optimizer1 = Optimizer()
+    optimizer2 = RandomSearchOptimizer()
+
+    opt_strat = CustomOptimizationStrategy()
+    opt_strat.add_optimizer(optimizer1, duration=0.5)
+    opt_strat.add_optimizer(optimizer2, duration=0.5)
+
+    n_iter = 30
+
+    hyper = Hyperactive()
+    hyper.add_search(
+        objective_function,
+        search_space,
+        optimizer=opt_strat,
+        n_iter=n_iter,
+        max_score=0,
+        initialize={"warm_start": [{"x1": 0}]},
+    )
+    hyper.run()
+
+    optimizer2 = hyper.opt_pros[0].optimizer_setup_l[1]["optimizer"]
+
+    # max_score=0 disables the stop, so the second optimizer still runs
+    assert optimizer2.search_data is not None
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import pytest
 import numpy as np
 
@@ -36,3 +38,41 @@ def test_memory_0(Optimizer):
         n_jobs=2,
     )
     hyper.run()
+
+
+def test_memory_close_0():
+    hyper = Hyperactive()
+    hyper.add_search(objective_function, search_space, n_iter=15, n_jobs=2)
+    hyper.run()
+
+    assert len(hyper._managers) == 1
+
+    hyper.close()
+
+    assert hyper._managers == []
+    assert hyper.opt_pros[0].memory == "share"
+
+    hyper.run()
+
+    assert len(hyper._managers) == 1
+    assert len(hyper.results_list) == 2
+
+    hyper.close()
+
+
+def test_memory_pickle_0():
+    hyper = Hyperactive()
+    hyper.add_search(objective_function, search_space, n_iter=15, n_jobs=2)
+    hyper.run()
+
+    hyper_pickled = pickle.loads(pickle.dumps(hyper))
+    hyper_copy = copy.deepcopy(hyper)
+
+    assert hyper_pickled.best_para(objective_function) == hyper.best_para(
+        objective_function
+    )
+    assert hyper_copy.best_score(objective_function) == hyper.best_score(
+        objective_function
+    )
+
+    hyper.close()
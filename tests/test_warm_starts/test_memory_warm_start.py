@@ -123,3 +123,24 @@ def test_memory_warm_start_3():
         memory_warm_start=search_data0,
     )
     hyper1.run()
+
+
+def test_memory_warm_start_4():
+    hyper0 = Hyperactive()
+    hyper0.add_search(objective_function, search_space, n_iter=15)
+    hyper0.run()
+
+    search_data0 = hyper0.search_data(objective_function)
+    search_data0.index = search_data0.index + 100
+    index0 = search_data0.index.copy()
+
+    hyper1 = Hyperactive()
+    hyper1.add_search(
+        objective_function,
+        search_space,
+        n_iter=15,
+        memory_warm_start=search_data0,
+    )
+    hyper1.run()
+
+    assert search_data0.index.equals(index0)
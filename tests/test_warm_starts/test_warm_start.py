@@ -123,3 +123,25 @@ def test_warm_start_3():
         initialize={"warm_start": [best_para0]},
     )
     hyper1.run()
+
+
+def test_warm_start_4():
+    warm_start = {
+        "x0": 0,
+        "x1": 0,
+        "string0": ["str0"],
+        "function0": func1,
+        "class0": class_f1,
+        "numpy0": numpy_f1,
+    }
+
+    hyper = Hyperactive()
+    hyper.add_search(
+        objective_function,
+        search_space,
+        n_iter=15,
+        initialize={"warm_start": [warm_start]},
+    )
+
+    with pytest.raises(ValueError):
+        hyper.run()